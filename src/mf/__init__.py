@@ -1,9 +1,17 @@
 """media file finder and player."""
 
-from . import utils
-from .cli_main import app_mf
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from . import utils
+    from .cli_main import app_mf
+
 __all__ = [
     "__version__",
     "app_mf",
@@ -11,6 +19,29 @@ __all__ = [
     "utils",
 ]
 
+# Attributes that are loaded on first access (PEP 562) so that importing the package
+# doesn't pull in the full CLI and its dependencies.
+_LAZY_ATTRIBUTES = {
+    "app_mf": ".cli_main",
+    "utils": ".utils",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazily import and return package attributes listed in _LAZY_ATTRIBUTES."""
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = import_module(_LAZY_ATTRIBUTES[name], __name__)
+    value = module if name == "utils" else getattr(module, name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__() -> list[str]:  # noqa: D105
+    return sorted(set(globals()) | set(__all__))
+
 
 def main():
     """Main entry point for the mf CLI application.
@@ -18,4 +49,43 @@ def main():
     This function is called when the package is executed as a script
     or via the installed console script 'mf' or 'mediafinder'.
     """
+    args = sys.argv[1:]
+
+    # Plain 'mf version' needs none of the CLI, skip building it
+    if args == ["version"]:
+        from .version import print_version
+
+        print_version()
+        return
+
+    # 'mf filepath <index>' is mostly used in scripts and shell substitutions, which
+    # call it a lot, so answer it without building the CLI as well. isdecimal() rather
+    # than isdigit(), which also accepts characters like "²" that int() rejects.
+    if len(args) == 2 and args[0] == "filepath" and args[1].isdecimal():
+        _print_filepath(int(args[1]))
+        return
+
+    from .cli_main import app_mf
+
     app_mf()
+
+
+def _print_filepath(index: int):
+    """Same as 'mf filepath <index>', without going through the Typer app.
+
+    Args:
+        index (int): Index of the search result.
+    """
+    import typer
+
+    from .utils.file import remove_temp_paths
+    from .utils.search import get_result_by_index
+
+    # Normally done by the app callback
+    remove_temp_paths()
+
+    try:
+        print(get_result_by_index(index).file)
+    except typer.Exit as e:
+        # Outside of the Typer app, so exit like it would
+        sys.exit(e.exit_code)
@@ -5,9 +5,10 @@ stores metadata about all media files in configured search paths to speed up
 queries and enable statistics without filesystem scanning.
 
 Command Structure:
-    mf cache rebuild    # Force rebuild of library cache
-    mf cache file       # Print cache file location
-    mf cache clear      # Delete the cache file
+    mf cache rebuild       # Force rebuild of library cache
+    mf cache file          # Print cache file location
+    mf cache clear         # Delete the cache file
+    mf cache clear --imdb  # Delete cached IMDB lookups instead
 """
 
 from __future__ import annotations
@@ -16,7 +17,7 @@ import typer
 
 from .utils.cache import rebuild_library_cache
 from .utils.console import print_ok
-from .utils.file import get_library_cache_file
+from .utils.file import get_imdb_cache_file, get_library_cache_file
 
 app_cache = typer.Typer(help="Manage mf's library cache.")
 
@@ -34,7 +35,18 @@ def file():
 
 
 @app_cache.command()
-def clear():
-    """Clear the library cache."""
+def clear(
+    imdb: bool = typer.Option(
+        False,
+        "--imdb",
+        help="Clear cached IMDB lookups ('mf imdb') instead of the library cache.",
+    ),
+):
+    """Clear the library cache or cached IMDB lookups."""
+    if imdb:
+        get_imdb_cache_file().unlink(missing_ok=True)
+        print_ok("Cleared the IMDB lookup cache.")
+        return
+
     get_library_cache_file().unlink()
     print_ok("Cleared the library cache.")
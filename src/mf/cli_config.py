@@ -24,9 +24,7 @@ Features:
 
 from __future__ import annotations
 
-import tomlkit
 import typer
-from rich.syntax import Syntax
 
 from .utils.config import get_raw_config, list_settings
 from .utils.console import console, print_and_raise
@@ -52,29 +50,29 @@ def edit():
 @app_config.command(name="list")
 def list_config():
     "List the current configuration."
-    console.print(f"Configuration file: {get_config_file()}\n", style="dim")
-    console.print(
-        Syntax(
-            code=tomlkit.dumps(get_raw_config()),
-            lexer="toml",
-            line_numbers=True,
-        )
-    )
+    # Only needed here, import lazily so other config commands don't pay for Pygments
+    from rich.syntax import Syntax
+
+    # Loading the configuration creates or migrates the file if necessary, which then
+    # gets displayed as it is on disk instead of being dumped from the parsed document
+    get_raw_config()
+    config_file = get_config_file()
+    console.print(f"Configuration file: {config_file}\n", style="dim")
+    console.print(Syntax.from_path(str(config_file), lexer="toml", line_numbers=True))
 
 
 @app_config.command()
 def get(key: str):
     """Get a setting."""
-    try:
-        setting = get_raw_config()[key]
-    except tomlkit.exceptions.NonExistentKey as e:
+    # Check against the registry first so invalid keys don't need the config loaded.
+    # Loading migrates missing settings, so every registered key exists afterwards.
+    if key not in SETTINGS:
         print_and_raise(
             f"Invalid key: '{key}'. Available keys: "
-            f"{', '.join(repr(key) for key in SETTINGS)}",
-            raise_from=e,
+            f"{', '.join(repr(key) for key in SETTINGS)}"
         )
 
-    console.print(f"{key} = {SETTINGS[key].display(setting)}")
+    console.print(f"{key} = {SETTINGS[key].display(get_raw_config()[key])}")
 
 
 @app_config.command()
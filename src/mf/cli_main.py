@@ -43,11 +43,11 @@ Examples:
 
 from __future__ import annotations
 
+from importlib import import_module
+
 import typer
+from typer.core import TyperGroup
 
-from .cli_cache import app_cache
-from .cli_config import app_config
-from .cli_last import app_last
 from .utils.config import Configuration
 from .utils.console import console, plain_option, print_and_raise, print_warn
 from .utils.file import FileResult, FileResults, cleanup, extract_rar, remove_temp_paths
@@ -56,12 +56,46 @@ from .utils.play import launch_video_player, resolve_play_target
 from .utils.scan import FindQuery, NewQuery
 from .utils.search import get_result_by_index, print_search_results, save_search_results
 from .utils.stats import print_stats
-from .version import __version__, check_version
+from .version import __version__, check_version, print_version
+
+
+class LazyTyperGroup(TyperGroup):
+    """Command group that imports sub-apps only when they are needed.
+
+    Sub-apps are registered as "module:attribute" import strings and loaded on first
+    lookup, so a plain 'mf find' doesn't import the config, cache, and last command
+    modules. Help output still lists them because it looks up every command.
+    """
+
+    lazy_subcommands: dict[str, str] = {
+        "last": "mf.cli_last:app_last",
+        "config": "mf.cli_config:app_config",
+        "cache": "mf.cli_cache:app_cache",
+    }
+
+    def list_commands(self, ctx):
+        """List loaded commands followed by sub-apps that haven't been loaded yet."""
+        commands = super().list_commands(ctx)
+
+        return commands + [
+            name for name in self.lazy_subcommands if name not in commands
+        ]
+
+    def get_command(self, ctx, cmd_name):
+        """Return command by name, importing its sub-app on first lookup."""
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            sub_app = getattr(import_module(module_name), attribute)
+            # Build a plain group like add_typer() does. get_command() would add the
+            # shell completion options that belong to the top-level app only.
+            command = typer.main.get_group(sub_app)
+            command.name = cmd_name
+            self.add_command(command, cmd_name)
+
+        return super().get_command(ctx, cmd_name)
+
 
-app_mf = typer.Typer(help="Media file finder and player")
-app_mf.add_typer(app_last, name="last")
-app_mf.add_typer(app_config, name="config")
-app_mf.add_typer(app_cache, name="cache")
+app_mf = typer.Typer(cls=LazyTyperGroup, help="Media file finder and player")
 
 
 @app_mf.command()
@@ -171,9 +205,7 @@ def version(
     if target and target == "check":
         check_version()
     else:
-        console.print(f"mediafinder {__version__}")
-        console.print("Github: https://github.com/aplzr/mf")
-        console.print("PyPI: https://pypi.org/project/mediafinder")
+        print_version()
 
 
 @app_mf.command(name="cleanup")
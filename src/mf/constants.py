@@ -5,11 +5,13 @@ default configuration values, platform-specific settings, and UI symbols.
 
 Constants:
     DEFAULT_MEDIA_EXTENSIONS: Default video file extensions for new configs
+    DEFAULT_SKIP_DIRS: Default directory names skipped when scanning search paths
     BOOLEAN_TRUE_VALUES: Accepted strings for boolean true normalization
     BOOLEAN_FALSE_VALUES: Accepted strings for boolean false normalization
     FALLBACK_EDITORS_POSIX: Editor search order on Unix-like systems
     FD_BINARIES: Platform-to-binary mapping for vendored fd tool
     STATUS_SYMBOLS: Unicode symbols for console status messages
+    LARGE_RESULTS_THRESHOLD: Result count above which search results skip the table
 
 Platform Support:
     FD_BINARIES maps (system, machine) tuples to fd binary filenames for
@@ -30,9 +32,27 @@ DEFAULT_MEDIA_EXTENSIONS: list[str] = [
     ".rar",
 ]
 
+# Default names of directories that are skipped when scanning search paths. Metadata,
+# trash, and version control directories created by NAS systems, operating systems,
+# and tools don't contain media worth finding but can contain lots of files.
+DEFAULT_SKIP_DIRS: list[str] = [
+    "@eaDir",
+    "#recycle",
+    "$RECYCLE.BIN",
+    "System Volume Information",
+    ".Trash-1000",
+    ".AppleDouble",
+    ".git",
+    ".svn",
+]
+
 # Boolean normalization sets (lowercase tokens)
-BOOLEAN_TRUE_VALUES: set[str] = {"1", "true", "yes", "y", "on", "enable", "enabled"}
-BOOLEAN_FALSE_VALUES: set[str] = {"0", "false", "no", "n", "off", "disable", "disabled"}
+BOOLEAN_TRUE_VALUES: frozenset[str] = frozenset(
+    {"1", "true", "yes", "y", "on", "enable", "enabled"}
+)
+BOOLEAN_FALSE_VALUES: frozenset[str] = frozenset(
+    {"0", "false", "no", "n", "off", "disable", "disabled"}
+)
 
 # POSIX fallback editors in order of preference.
 FALLBACK_EDITORS_POSIX: list[str] = ["nano", "vim", "vi"]
@@ -55,3 +75,7 @@ STATUS_SYMBOLS = {
 
 # Directory name prefix for temporary directories created / used by mediafinder
 TEMP_DIR_PREFIX = "mediafinder_video_"
+
+# Search results with more entries than this are printed as plain styled lines instead
+# of a table, which has to measure every cell before it can render anything.
+LARGE_RESULTS_THRESHOLD = 1000
@@ -54,6 +54,7 @@ from .file import (
     get_cache_dir,
     get_library_cache_file,
     get_search_cache_file,
+    open_atomic,
     open_utf8,
 )
 from .validation import validate_search_cache
@@ -134,7 +135,7 @@ def rebuild_library_cache() -> FileResults:
         ],
     }
 
-    with open(get_library_cache_file(), "wb") as f:
+    with open_atomic(get_library_cache_file(), "wb") as f:
         pickle.dump(cache_data, f, protocol=PICKLE_PROTOCOL)
 
     print_ok("Cache rebuilt.")
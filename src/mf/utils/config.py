@@ -166,6 +166,7 @@ class Configuration:
 
     search_paths: list[Path]
     media_extensions: list[str]
+    skip_dirs: list[str]
     fullscreen_playback: bool
     prefer_fd: bool
     cache_library: bool
@@ -17,6 +17,10 @@ Directory Layout:
     Cache:  $XDG_CACHE_HOME/mf/ (or ~/.cache/mf/)
         - library.pkl: Pickle cache of media files (path and stat metadata)
         - last_search.json: Most recent search results
+        - imdb.json: IMDB lookups by filename
+
+Cache files are written atomically via open_atomic, so an interrupted write leaves
+the previous version intact instead of a truncated file.
 
 The FileResults collection supports:
     - Extension filtering
@@ -51,18 +55,22 @@ from __future__ import annotations
 
 import os
 import platform
+import re
 import stat
 import tempfile
 from collections import UserList
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 from importlib.resources import files
 from io import TextIOWrapper
 from operator import attrgetter
 from pathlib import Path
 from shutil import rmtree
 from time import time
-from typing import TYPE_CHECKING, Literal
+from typing import IO, TYPE_CHECKING, Any, Literal
 
 import typer
 from patoolib import extract_archive, supported_formats
@@ -90,6 +98,37 @@ def open_utf8(
     return open(file, mode, encoding="utf-8", **kwargs)
 
 
+@contextmanager
+def open_atomic(file: Path, mode: Literal["w", "wb"] = "w") -> Iterator[IO[Any]]:
+    """Open a file for writing that only replaces the target once writing succeeded.
+
+    Writes go to a temporary file in the same directory, which is moved over the
+    target when the context exits without error, or removed otherwise.
+
+    Args:
+        file (Path): File to write.
+        mode (Literal["w", "wb"], optional): Text (utf-8) or binary write mode.
+            Defaults to "w".
+
+    Yields:
+        IO[Any]: Opened temporary file.
+    """
+    fd, tmp_file = tempfile.mkstemp(
+        dir=file.parent, prefix=f".{file.name}.", suffix=".tmp"
+    )
+
+    try:
+        with os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8") as f:
+            yield f
+
+        os.replace(tmp_file, file)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_file)
+
+        raise
+
+
 def get_cache_dir() -> Path:
     """Return path to the cache directory.
 
@@ -130,6 +169,15 @@ def get_library_cache_file() -> Path:
     return get_cache_dir() / "library.pkl"
 
 
+def get_imdb_cache_file() -> Path:
+    """Return path to the IMDB lookup cache file.
+
+    Returns:
+        Path: Location of the JSON IMDB lookup cache file.
+    """
+    return get_cache_dir() / "imdb.json"
+
+
 def get_fd_binary() -> Path:
     """Resolve path to packaged fd binary.
 
@@ -223,6 +271,22 @@ class FileResult:
         return cls(Path(path))
 
 
+@lru_cache(maxsize=64)
+def _compile_glob(pattern: str) -> re.Pattern[str]:
+    """Compile a glob pattern to a case-insensitive regular expression.
+
+    Matching case-insensitively avoids lowercasing every file name. Cached because
+    patterns are often reused.
+
+    Args:
+        pattern (str): Glob-style pattern.
+
+    Returns:
+        re.Pattern[str]: Compiled pattern.
+    """
+    return re.compile(translate(pattern), re.IGNORECASE)
+
+
 class FileResults(UserList[FileResult]):
     """Collection of FileResult objects.
 
@@ -288,10 +352,10 @@ class FileResults(UserList[FileResult]):
         if not self.data or not media_extensions:
             return
 
+        # Constant time membership tests instead of scanning the list for every file
+        extensions = frozenset(media_extensions)
         self.data = [
-            result
-            for result in self.data
-            if result.file.suffix.lower() in media_extensions
+            result for result in self.data if result.file.suffix.lower() in extensions
         ]
 
     def filtered_by_extension(
@@ -313,14 +377,12 @@ class FileResults(UserList[FileResult]):
         Args:
             pattern (str): Glob-style pattern to match against filenames.
         """
-        if not self.data or pattern == "*":
+        # Patterns consisting only of wildcards ("*", "**", ...) match every file
+        if not self.data or (pattern and not pattern.strip("*")):
             return
 
-        self.data = [
-            result
-            for result in self.data
-            if fnmatch(result.file.name.lower(), pattern.lower())
-        ]
+        match = _compile_glob(pattern).match
+        self.data = [result for result in self.data if match(result.file.name)]
 
     def filtered_by_pattern(self, pattern: str) -> FileResults:
         """Return new collection filtered by filename pattern.
@@ -373,7 +435,11 @@ class FileResults(UserList[FileResult]):
                 reverse=not reverse,  # Sort descending by default
             )
         else:
-            self.data.sort(key=lambda result: result.file.name.lower(), reverse=reverse)
+            # casefold() matches lower() on ASCII names and also folds non-ASCII case
+            # variants (e.g. "ß" and "ss") together
+            self.data.sort(
+                key=lambda result: result.file.name.casefold(), reverse=reverse
+            )
 
     def sorted(self, *, by_mtime: bool = False, reverse: bool = False) -> FileResults:
         """Return new sorted collection by file path or modification time.
@@ -442,6 +508,7 @@ def cleanup():
             get_config_file(),
             get_library_cache_file(),
             get_search_cache_file(),
+            get_imdb_cache_file(),
         ]
         if file.exists()
     ]
@@ -21,20 +21,21 @@ def load_library(show_progress: bool = False) -> FileResults:
     from .scan import FindQuery
 
     cfg = Configuration.from_config()
-    cache_library = cfg.cache_library
-
-    return (
-        load_library_cache().filtered_by_extension(cfg.media_extensions)
-        if cache_library
-        else FindQuery(
-            "*",
-            auto_wildcards=False,
-            cache_stat=True,
-            show_progress=True,
-            cache_library=False,
-            media_extensions=cfg.media_extensions,
-        ).execute()
-    )
+
+    if cfg.cache_library:
+        # Freshly loaded, so it can be filtered in-place instead of copied first
+        library = load_library_cache()
+        library.filter_by_extension(cfg.media_extensions)
+        return library
+
+    return FindQuery(
+        "*",
+        auto_wildcards=False,
+        cache_stat=True,
+        show_progress=True,
+        cache_library=False,
+        media_extensions=cfg.media_extensions,
+    ).execute()
 
 
 def split_by_search_path(
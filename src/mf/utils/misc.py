@@ -16,10 +16,12 @@ Editor Resolution:
 IMDB Integration:
     Uses guessit for filename parsing and imdbinfo for searching.
     Opens first matching title in the default browser.
+    Successful lookups are cached by filename, repeated lookups skip both.
 """
 
 from __future__ import annotations
 
+import json
 import os
 import shutil
 import subprocess
@@ -29,7 +31,7 @@ import typer
 
 from ..constants import FALLBACK_EDITORS_POSIX
 from .console import console, print_and_raise
-from .file import FileResult
+from .file import FileResult, get_imdb_cache_file, open_atomic, open_utf8
 
 
 def start_editor(file: Path):
@@ -60,30 +62,71 @@ def start_editor(file: Path):
         console.print(f"No editor found. Edit manually: {file}")
 
 
+def _load_imdb_cache() -> dict[str, dict[str, str]]:
+    """Load cached IMDB lookups.
+
+    Returns:
+        dict[str, dict[str, str]]: Parsed title and IMDB URL by filename stem. Empty
+            if there is no (readable) cache or it doesn't have the expected structure.
+    """
+    try:
+        with open_utf8(get_imdb_cache_file()) as f:
+            imdb_cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(imdb_cache, dict) or not all(
+        isinstance(entry, dict)
+        and isinstance(entry.get("title"), str)
+        and isinstance(entry.get("url"), str)
+        for entry in imdb_cache.values()
+    ):
+        return {}
+
+    return imdb_cache
+
+
 def open_imdb_entry(result: FileResult):
     """Print IMDB URL and open it in the default browser if one is available.
 
+    Lookups are cached by filename stem, so repeated lookups of the same file skip
+    filename parsing and the IMDB search.
+
     Args:
         result (FileResult): File for which to open the IMDB entry.
     """
-    # Heavy imports, import here lazily so they don't slow down every mf invocation
-    from guessit import guessit
-    from imdbinfo import search_title
+    stem = result.file.stem
+    imdb_cache = _load_imdb_cache()
+
+    if stem in imdb_cache:
+        title = imdb_cache[stem]["title"]
+        imdb_url = imdb_cache[stem]["url"]
+    else:
+        # Heavy imports, import here lazily so they don't slow down every mf invocation
+        from guessit import guessit
+        from imdbinfo import search_title
+
+        parsed = guessit(stem)
 
-    parsed = guessit(result.file.stem)
+        if "title" not in parsed:
+            print_and_raise(
+                f"Could not parse a title from filename '{result.file.name}'."
+            )
 
-    if "title" not in parsed:
-        print_and_raise(f"Could not parse a title from filename '{result.file.name}'.")
+        title = parsed["title"]
+        results = search_title(title)
 
-    title = parsed["title"]
-    results = search_title(title)
+        if not (results and results.titles):
+            print_and_raise(f"No IMDB results found for parsed title '{title}'.")
 
-    if results and results.titles:
         imdb_url = results.titles[0].url
-        console.print(f"IMDB entry for [green]{title}[/green]: {imdb_url}")
-        typer.launch(imdb_url)
-    else:
-        print_and_raise(f"No IMDB results found for parsed title '{title}'.")
+        imdb_cache[stem] = {"title": title, "url": imdb_url}
+
+        with open_atomic(get_imdb_cache_file()) as f:
+            json.dump(imdb_cache, f)
+
+    console.print(f"IMDB entry for [green]{title}[/green]: {imdb_url}")
+    typer.launch(imdb_url)
 
 
 def format_size(size_bytes: int | float) -> str:
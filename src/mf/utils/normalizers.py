@@ -8,6 +8,7 @@ Normalization Functions:
     normalize_bool_str: Convert string literals to boolean values
     normalize_path: Convert relative paths to absolute POSIX-style
     normalize_media_extension: Ensure extensions have leading dot and lowercase
+    normalize_dir_name: Strip whitespace from directory names and reject empty ones
     normalize_pattern: Auto-wrap patterns without wildcards with *pattern*
     normalize_bool_to_toml: Convert boolean to TOML representation
 
@@ -27,6 +28,7 @@ from .console import print_and_raise
 
 __all__ = [
     "normalize_bool_str",
+    "normalize_dir_name",
     "normalize_media_extension",
     "normalize_path",
     "normalize_pattern",
@@ -99,6 +101,27 @@ def normalize_media_extension(extension: str) -> str:
     return "." + extension
 
 
+def normalize_dir_name(name: str) -> str:
+    """Normalize a directory name.
+
+    Args:
+        name (str): Raw directory name.
+
+    Raises:
+        typer.Exit: If the name is empty after stripping whitespace.
+
+    Returns:
+        str: Directory name without surrounding whitespace.
+    """
+    name = name.strip()
+
+    # An empty name would make fd exclude everything
+    if not name:
+        print_and_raise("Directory name can't be empty.")
+
+    return name
+
+
 def normalize_pattern(pattern: str) -> str:
     """Normalize a search pattern.
 
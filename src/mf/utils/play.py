@@ -69,8 +69,8 @@ def resolve_play_target(
         FileResult | FileResults: Single file or files to play.
     """
     if target is None:
-        # Play random file
-        all_files = FindQuery.from_config("*").execute()
+        # Play random file, order doesn't matter so skip sorting the whole library
+        all_files = FindQuery.from_config("*", sort=False).execute()
 
         if not all_files:
             print_and_raise("No media files found (empty collection).")
@@ -309,6 +309,10 @@ def launch_video_player(media: FileResult | FileResults, cfg: Configuration):
             player_args,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
+            # File descriptors are non-inheritable by default, so there is nothing to
+            # close on POSIX. Not closing them lets CPython use posix_spawn instead of
+            # fork + exec.
+            close_fds=os.name == "nt",
         )
         console.print(
             f"[green]{STATUS_SYMBOLS['ok']}[/green]  "
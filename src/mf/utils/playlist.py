@@ -51,7 +51,7 @@ import json
 
 from .cache import _load_search_cache
 from .console import print_and_raise
-from .file import FileResult, get_search_cache_file, open_utf8
+from .file import FileResult, get_search_cache_file, open_atomic
 
 
 def save_last_played(result: FileResult):
@@ -65,8 +65,8 @@ def save_last_played(result: FileResult):
     last_played_index = last_search_results.index(str(result))
     cached["last_played_index"] = last_played_index
 
-    with open_utf8(get_search_cache_file(), "w") as f:
-        json.dump(cached, f, indent=2)
+    with open_atomic(get_search_cache_file()) as f:
+        json.dump(cached, f)
 
 
 def get_last_played_index() -> int | None:
@@ -68,7 +68,9 @@ Example:
 
 from __future__ import annotations
 
+import heapq
 import os
+import re
 import subprocess
 import threading
 import time
@@ -76,6 +78,8 @@ from abc import ABC, abstractmethod
 from collections.abc import Callable
 from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 from subprocess import CalledProcessError
 
@@ -101,6 +105,15 @@ class ScanStrategy(ABC):
     error handling, and result aggregation.
     """
 
+    def __init__(self, skip_dirs: frozenset[str] = frozenset()):
+        """Initialize the scanning strategy.
+
+        Args:
+            skip_dirs (frozenset[str], optional): Names of directories to skip.
+                Defaults to an empty set.
+        """
+        self.skip_dirs = skip_dirs
+
     @abstractmethod
     def scan(self, search_paths: list[Path], max_workers: int) -> FileResults:
         """Scan search paths for files.
@@ -118,14 +131,39 @@ class ScanStrategy(ABC):
 class FdScanStrategy(ScanStrategy):
     """Uses the vendored fd binary for fast scans without mtime."""
 
+    def __init__(
+        self,
+        skip_dirs: frozenset[str] = frozenset(),
+        media_extensions: list[str] | None = None,
+    ):
+        """Initialize the scanning strategy.
+
+        Args:
+            skip_dirs (frozenset[str], optional): Names of directories to skip.
+                Defaults to an empty set.
+            media_extensions (list[str] | None, optional): Only let fd return files
+                with these extensions. Returns all files if None. Defaults to None.
+        """
+        super().__init__(skip_dirs)
+        self.media_extensions = media_extensions
+
     def scan(self, search_paths: list[Path], max_workers: int) -> FileResults:
         """Scan using fd binary with automatic fallback to Python scanner."""
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             try:
-                path_results = list(executor.map(scan_path_with_fd, search_paths))
+                # Resolve the binary once instead of once per search path
+                fd_scanner = partial(
+                    scan_path_with_fd,
+                    skip_dirs=self.skip_dirs,
+                    media_extensions=self.media_extensions,
+                    fd_binary=get_fd_binary(),
+                )
+                path_results = list(executor.map(fd_scanner, search_paths))
             except (FileNotFoundError, CalledProcessError, OSError):
                 print_warn("fd scanner unavailable, falling back to python scanner.")
-                fallback_strategy = PythonSilentScanStrategy(cache_stat=False)
+                fallback_strategy = PythonSilentScanStrategy(
+                    cache_stat=False, skip_dirs=self.skip_dirs
+                )
                 return fallback_strategy.scan(search_paths, max_workers)
 
             return concatenate_fileresults(path_results)
@@ -134,13 +172,16 @@ class FdScanStrategy(ScanStrategy):
 class PythonScanStrategy(ScanStrategy):
     """Uses the python scanner, optionally with stat caching."""
 
-    def __init__(self, cache_stat: bool):
+    def __init__(self, cache_stat: bool, skip_dirs: frozenset[str] = frozenset()):
         """Initialize the scanning strategy.
 
         Args:
             cache_stat (bool): Caches each file's stat information at the cost of an
                 additional syscall per file.
+            skip_dirs (frozenset[str], optional): Names of directories to skip.
+                Defaults to an empty set.
         """
+        super().__init__(skip_dirs)
         self.cache_stat = cache_stat
 
 
@@ -151,7 +192,9 @@ class PythonSilentScanStrategy(PythonScanStrategy):
         """Scan using the python scanner without progress bar."""
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             partial_python_scanner = partial(
-                scan_path_with_python, with_mtime=self.cache_stat
+                scan_path_with_python,
+                with_mtime=self.cache_stat,
+                skip_dirs=self.skip_dirs,
             )
             path_results = list(executor.map(partial_python_scanner, search_paths))
 
@@ -178,6 +221,7 @@ class PythonProgressScanStrategy(PythonScanStrategy):
                 scan_path_with_python,
                 with_mtime=self.cache_stat,
                 progress_callback=progress_callback,
+                skip_dirs=self.skip_dirs,
             )
 
             futures = [
@@ -192,7 +236,11 @@ class PythonProgressScanStrategy(PythonScanStrategy):
 
 
 def get_scan_strategy(
-    cache_stat: bool, prefer_fd: bool, show_progress: bool
+    cache_stat: bool,
+    prefer_fd: bool,
+    show_progress: bool,
+    skip_dirs: frozenset[str] = frozenset(),
+    media_extensions: list[str] | None = None,
 ) -> ScanStrategy:
     """Get the correct scanning strategy for a specific scenario.
 
@@ -201,17 +249,21 @@ def get_scan_strategy(
             syscall per file.
         prefer_fd (bool): Prefer the faster fd scanner unless stat caching is requested.
         show_progress (bool): Show progress bar during scanning (python scanner only).
+        skip_dirs (frozenset[str], optional): Names of directories to skip. Defaults
+            to an empty set.
+        media_extensions (list[str] | None, optional): Extensions the fd scanner
+            filters by (fd scanner only). Defaults to None.
 
     Returns:
         ScanStrategy: Selected strategy.
     """
     if prefer_fd and not cache_stat:
-        return FdScanStrategy()
+        return FdScanStrategy(skip_dirs=skip_dirs, media_extensions=media_extensions)
 
     if show_progress:
-        return PythonProgressScanStrategy(cache_stat=cache_stat)
+        return PythonProgressScanStrategy(cache_stat=cache_stat, skip_dirs=skip_dirs)
     else:
-        return PythonSilentScanStrategy(cache_stat=cache_stat)
+        return PythonSilentScanStrategy(cache_stat=cache_stat, skip_dirs=skip_dirs)
 
 
 def concatenate_fileresults(path_results: list[FileResults]) -> FileResults:
@@ -223,10 +275,12 @@ def concatenate_fileresults(path_results: list[FileResults]) -> FileResults:
     Returns:
         FileResults: Concatenated FileResults.
     """
+    # Build the combined list in one go instead of growing it per search path, and
+    # assign it directly since passing a list to FileResults() would copy it again
     concatenated_results = FileResults()
-
-    for results in path_results:
-        concatenated_results.extend(results)
+    concatenated_results.data = list(
+        chain.from_iterable(results.data for results in path_results)
+    )
 
     return concatenated_results
 
@@ -236,10 +290,12 @@ def scan_search_paths(
     cache_stat: bool = False,
     prefer_fd: bool | None = None,
     show_progress: bool = False,
+    media_extensions: list[str] | None = None,
 ) -> FileResults:
     """Scan configured search paths.
 
-    Returns paths of all files stored in the search paths.
+    Returns paths of all files stored in the search paths, optionally only those with
+    specific extensions.
 
     Args:
         cache_stat (bool, optional): Cache each file's stat info at the cost of an
@@ -249,6 +305,9 @@ def scan_search_paths(
             Defaults to None.
         show_progress (bool, optional): Show progress bar during scanning. Defaults to
             False.
+        media_extensions (list[str] | None, optional): Only return files with these
+            extensions. The fd scanner filters while scanning, so other files never
+            reach python. Returns all files if None. Defaults to None.
 
     Returns:
         FileResults: Results, optionally with stat info.
@@ -260,9 +319,14 @@ def scan_search_paths(
         prefer_fd = cfg.prefer_fd
 
     max_workers = get_max_workers(search_paths, cfg.parallel_search)
-    strategy = get_scan_strategy(cache_stat, prefer_fd, show_progress)
+    strategy = get_scan_strategy(
+        cache_stat, prefer_fd, show_progress, frozenset(cfg.skip_dirs), media_extensions
+    )
+    results = strategy.scan(search_paths, max_workers)
+    # Python scanners (and the fd fallback) return all files
+    results.filter_by_extension(media_extensions)
 
-    return strategy.scan(search_paths, max_workers)
+    return results
 
 
 def _scan_with_progress_bar(
@@ -396,11 +460,21 @@ def _process_completed_futures(
 
 def scan_path_with_fd(
     search_path: Path,
+    skip_dirs: frozenset[str] = frozenset(),
+    media_extensions: list[str] | None = None,
+    fd_binary: Path | None = None,
 ) -> FileResults:
     """Scan a directory using fd.
 
     Args:
         search_path (Path): Directory to scan.
+        skip_dirs (frozenset[str], optional): Names of directories to skip. Defaults
+            to an empty set.
+        media_extensions (list[str] | None, optional): Only return files with these
+            extensions (matched case-insensitively by fd). Returns all files if None.
+            Defaults to None.
+        fd_binary (Path | None, optional): fd executable to use. Resolved with
+            get_fd_binary if None. Defaults to None.
 
     Raises:
         subprocess.CalledProcessError: If fd exits with non-zero status.
@@ -409,31 +483,51 @@ def scan_path_with_fd(
         FileResults: All files in search path.
     """
     cmd = [
-        str(get_fd_binary()),
+        str(fd_binary or get_fd_binary()),
         "--type",
         "f",
         "--absolute-path",
         "--hidden",
-        ".",
-        str(search_path),
     ]
 
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, check=True, encoding="utf-8"
+    for name in skip_dirs:
+        # An empty pattern would exclude everything
+        if not name:
+            continue
+
+        # fd takes glob patterns, escape them so names are matched literally. The
+        # trailing slash only matches directories, like the Python scanner does.
+        cmd.extend(["--exclude", f"{_escape_glob(name)}/"])
+
+    for extension in media_extensions or []:
+        cmd.extend(["--extension", extension.lstrip(".")])
+
+    cmd.extend([".", str(search_path)])
+
+    # Split raw bytes and decode each path with the file system encoding instead of
+    # decoding the whole output as text first. Also keeps file names that aren't
+    # valid UTF-8 from crashing the scan.
+    result = subprocess.run(cmd, capture_output=True, check=True)
+
+    return FileResults(
+        [
+            FileResult(Path(os.fsdecode(line)))
+            for line in result.stdout.splitlines()
+            if line
+        ]
     )
-    files = FileResults()
 
-    for line in result.stdout.strip().split("\n"):
-        if line:
-            files.append(FileResult(Path(line)))
 
-    return files
+def _escape_glob(name: str) -> str:
+    # Wrap glob metacharacters in brackets so they match literally
+    return re.sub(r"[*?\[\]{}]", lambda match: f"[{match.group()}]", name)
 
 
 def scan_path_with_python(
     search_path: Path,
     with_mtime: bool = False,
     progress_callback: Callable[[FileResult], None] | None = None,
+    skip_dirs: frozenset[str] = frozenset(),
 ) -> FileResults:
     """Recursively scan a directory using Python.
 
@@ -442,19 +536,30 @@ def scan_path_with_python(
         with_mtime (bool): Include modification time in results.
         progress_callback (Callable[[FileResult], None] | None): Called for each file
             found. Can be used for live progress tracking (optional, defaults to None).
+        skip_dirs (frozenset[str], optional): Names of directories to skip. Defaults
+            to an empty set.
 
     Returns:
         FileResults: All files in the search path, optionally paired with mtime.
     """
     results = FileResults()
+    # Directories still to be scanned. Iterative instead of recursive to avoid a
+    # function call per directory and recursion limits on deeply nested trees.
+    directories = [str(search_path)]
+
+    while directories:
+        path = directories.pop()
 
-    def scan_dir(path: str):
         try:
             with os.scandir(path) as entries:
                 for entry in entries:
                     if entry.is_file(follow_symlinks=False):
                         if with_mtime:
-                            file_result = FileResult(Path(entry.path), entry.stat())
+                            # Known not to be a symlink, so there's nothing to follow
+                            # and no need to check
+                            file_result = FileResult(
+                                Path(entry.path), entry.stat(follow_symlinks=False)
+                            )
                         else:
                             file_result = FileResult(Path(entry.path))
 
@@ -463,12 +568,14 @@ def scan_path_with_python(
                         if progress_callback:
                             progress_callback(file_result)
 
-                    elif entry.is_dir(follow_symlinks=False):
-                        scan_dir(entry.path)
+                    elif (
+                        entry.is_dir(follow_symlinks=False)
+                        and entry.name not in skip_dirs
+                    ):
+                        directories.append(entry.path)
         except PermissionError:
             print_warn(f"Missing access permissions for directory {path}, skipping.")
 
-    scan_dir(str(search_path))
     return results
 
 
@@ -541,17 +648,18 @@ class Query(ABC):
         self.media_extensions = media_extensions
 
     @classmethod
-    def _get_config_params(cls) -> dict:
+    def _get_config_params(cls, cfg: Configuration) -> dict:
         """Get configuration parameters for query initialization.
 
-        Returns the following parameters from the current configuration:
+        Returns the following parameters from the given configuration:
         {
             "cache_library": <bool>,
             "media_extensions": <list[str]>,
         }
-        """
-        cfg = Configuration.from_config()
 
+        Args:
+            cfg (Configuration): Configuration to take the parameters from.
+        """
         return {
             "cache_library": cfg.cache_library,
             "media_extensions": cfg.media_extensions,
@@ -581,6 +689,7 @@ class FindQuery(Query):
         cache_stat (bool): Cache each file's stat info at the cost of an
                 additional syscall per file. Defaults to False.
         show_progress (bool): Show progress bar during scanning. Defaults to False.
+        sort (bool): Sort results alphabetically. Defaults to True.
         cache_library (bool): Loads library metadata from cache if True, performs
             a fresh filescan otherwise.
         media_extensions (list[str]): Media extensions to filter by.
@@ -592,6 +701,7 @@ class FindQuery(Query):
         auto_wildcards: bool,
         cache_stat: bool = False,
         show_progress: bool = False,
+        sort: bool = True,
         *,
         cache_library: bool,
         media_extensions: list[str],
@@ -606,6 +716,8 @@ class FindQuery(Query):
                 additional syscall per file. Defaults to False.
             show_progress (bool, optional): Show progress bar during scanning. Defaults
                 to False.
+            sort (bool, optional): Sort results alphabetically. Turn off if order
+                doesn't matter. Defaults to True.
             cache_library (bool): Loads library metadata from cache if True, performs
                 a fresh filescan otherwise.
             media_extensions (list[str]): Media extensions to filter by.
@@ -618,6 +730,7 @@ class FindQuery(Query):
 
         self.cache_stat = cache_stat
         self.show_progress = show_progress
+        self.sort = sort
 
         super().__init__(
             cache_library=cache_library,
@@ -626,7 +739,11 @@ class FindQuery(Query):
 
     @classmethod
     def from_config(
-        cls, pattern: str, cache_stat: bool = False, show_progress: bool = False
+        cls,
+        pattern: str,
+        cache_stat: bool = False,
+        show_progress: bool = False,
+        sort: bool = True,
     ) -> FindQuery:
         """Create FindQuery from current configuration.
 
@@ -636,37 +753,45 @@ class FindQuery(Query):
                 additional syscall per file. Defaults to False.
             show_progress (bool, optional): Show progress bar during scanning. Defaults
                 to False.
+            sort (bool, optional): Sort results alphabetically. Defaults to True.
 
         Returns:
             FindQuery: FindQuery initialized with pattern and parameters from current
                 configuration.
         """
+        cfg = Configuration.from_config()
+
         return cls(
             pattern=pattern,
-            auto_wildcards=Configuration.from_config().auto_wildcards,
+            auto_wildcards=cfg.auto_wildcards,
             cache_stat=cache_stat,
             show_progress=show_progress,
-            **cls._get_config_params(),
+            sort=sort,
+            **cls._get_config_params(cfg),
         )
 
     def execute(self) -> FileResults:
         """Execute the query.
 
         Returns:
-            FileResults: Search results sorted alphabetically by filename.
+            FileResults: Search results, sorted alphabetically by filename unless
+                sorting is turned off.
         """
-        results = (
-            load_library_cache()
-            if self.cache_library
-            else scan_search_paths(
+        if self.cache_library:
+            results = load_library_cache()
+            results.filter_by_extension(self.media_extensions)
+        else:
+            # Already filtered by extension while scanning
+            results = scan_search_paths(
                 cache_stat=self.cache_stat,
                 show_progress=self.show_progress,
+                media_extensions=self.media_extensions,
             )
-        )
 
-        results.filter_by_extension(self.media_extensions)
         results.filter_by_pattern(self.pattern)
-        results.sort()
+
+        if self.sort:
+            results.sort()
 
         return results
 
@@ -728,7 +853,11 @@ class NewQuery(Query):
             NewQuery: NewQuery initialized with n and parameters from current
                 configuration.
         """
-        return cls(n=n, show_progress=show_progress, **cls._get_config_params())
+        return cls(
+            n=n,
+            show_progress=show_progress,
+            **cls._get_config_params(Configuration.from_config()),
+        )
 
     def execute(self) -> FileResults:
         """Execute the query.
@@ -740,14 +869,18 @@ class NewQuery(Query):
         if self.cache_library:
             # Already sorted by mtime
             results = load_library_cache()
-        else:
-            # Contains mtime but not sorted yet
-            results = scan_search_paths(
-                cache_stat=True,
-                show_progress=self.show_progress,
-            )
-            results.sort(by_mtime=True)
+            results.filter_by_extension(self.media_extensions)
 
+            return results[: self.n]
+
+        # Contains mtime but not sorted yet. Only n files are needed, so select them
+        # with a heap instead of sorting the whole library.
+        results = scan_search_paths(
+            cache_stat=True,
+            show_progress=self.show_progress,
+        )
         results.filter_by_extension(self.media_extensions)
 
-        return results[: self.n]
+        return FileResults(
+            heapq.nlargest(self.n, results, key=attrgetter("stat.st_mtime"))
+        )
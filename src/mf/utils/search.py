@@ -23,6 +23,8 @@ Display Format:
     - File names (green)
     - Optional parent paths (blue)
     - Last played item highlighted in bright cyan
+    Large result sets (see LARGE_RESULTS_THRESHOLD) are printed as styled lines
+    instead of a table.
 
 Index Convention:
     All functions use 1-based indexing to match the display. Internally
@@ -49,10 +51,12 @@ from datetime import datetime
 import typer
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
+from ..constants import LARGE_RESULTS_THRESHOLD
 from .cache import _load_search_cache
 from .console import console, print_and_raise
-from .file import FileResult, FileResults, get_search_cache_file, open_utf8
+from .file import FileResult, FileResults, get_search_cache_file, open_atomic
 from .playlist import get_last_played_index
 
 
@@ -74,6 +78,13 @@ def print_search_results(
         raise typer.Exit(0)
 
     max_index_width = len(str(len(results))) if results else 1
+    last_played_index = get_last_played_index()
+
+    if len(results) > LARGE_RESULTS_THRESHOLD:
+        _print_search_results_as_lines(
+            results, title, display_paths, max_index_width, last_played_index
+        )
+        return
 
     table = Table(show_header=False, box=None, padding=(0, 1))
     table.add_column("#", style="cyan", width=max_index_width, justify="right")
@@ -82,8 +93,6 @@ def print_search_results(
     if display_paths:
         table.add_column("Location", style="blue", overflow="fold")
 
-    last_played_index = get_last_played_index()
-
     for idx, result in enumerate(results):
         is_last_played = idx == last_played_index
 
@@ -111,6 +120,45 @@ def print_search_results(
     console.print(panel)
 
 
+def _print_search_results_as_lines(
+    results: FileResults,
+    title: str,
+    display_paths: bool,
+    max_index_width: int,
+    last_played_index: int | None,
+):
+    """Print search results as styled lines, for result sets too large for a table.
+
+    Args:
+        results (FileResults): Search results.
+        title (str): Title displayed above the results.
+        display_paths (bool): Whether to display file paths.
+        max_index_width (int): Width of the index column.
+        last_played_index (int | None): 0-based index of the last played file.
+    """
+    lines = Text()
+
+    for idx, result in enumerate(results):
+        is_last_played = idx == last_played_index
+
+        lines.append(
+            f"{idx + 1:>{max_index_width}} ",
+            style="bright_cyan" if is_last_played else "cyan",
+        )
+        lines.append(
+            result.file.name, style="bright_cyan" if is_last_played else "green"
+        )
+
+        if display_paths:
+            lines.append(f" {result.file.parent}", style="blue")
+
+        lines.append("\n")
+
+    console.print()
+    console.print(f"[bold]{title}[/bold]")
+    console.print(lines, end="")
+
+
 def save_search_results(pattern: str, results: FileResults) -> None:
     """Persist search results to cache.
 
@@ -126,8 +174,8 @@ def save_search_results(pattern: str, results: FileResults) -> None:
 
     cache_file = get_search_cache_file()
 
-    with open_utf8(cache_file, "w") as f:
-        json.dump(cache_data, f, indent=2)
+    with open_atomic(cache_file) as f:
+        json.dump(cache_data, f)
 
 
 def load_search_results() -> tuple[FileResults, str, datetime]:
@@ -157,15 +205,17 @@ def get_result_by_index(index: int) -> FileResult:
     Returns:
         FileResult: File for the given index.
     """
-    results, pattern, _ = load_search_results()
+    # Index the raw cached paths so only the requested result is turned into a
+    # FileResult
+    cache_data = _load_search_cache()
+    paths: list[str] = cache_data["results"]
 
-    try:
-        result = results[index - 1]
-    except IndexError as e:
+    # Indices are dense and 1-based, so a bounds check replaces catching IndexError,
+    # which would also let 0 and negative indices count from the end of the list
+    if not 1 <= index <= len(paths):
         print_and_raise(
-            f"Index {index} not found in last search results (pattern: '{pattern}'). "
-            f"Valid indices: 1-{len(results)}.",
-            raise_from=e,
+            f"Index {index} not found in last search results "
+            f"(pattern: '{cache_data['pattern']}'). Valid indices: 1-{len(paths)}."
         )
 
-    return result
+    return FileResult.from_string(paths[index - 1])
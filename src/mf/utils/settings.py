@@ -40,7 +40,7 @@ Examples:
     ...     key="new_setting",
     ...     kind="scalar",
     ...     value_type=str,
-    ...     actions={"set"},
+    ...     actions=frozenset({"set"}),
     ...     default="default_value",
     ...     help="Description of the setting"
     ... )
@@ -57,7 +57,9 @@ Examples:
 
 from __future__ import annotations
 
+import os
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
 from pathlib import Path
@@ -65,11 +67,12 @@ from typing import Any, Literal
 
 from tomlkit import TOMLDocument
 
-from ..constants import DEFAULT_MEDIA_EXTENSIONS
+from ..constants import DEFAULT_MEDIA_EXTENSIONS, DEFAULT_SKIP_DIRS
 from .console import print_and_raise, print_ok, print_warn
 from .normalizers import (
     normalize_bool_str,
     normalize_bool_to_toml,
+    normalize_dir_name,
     normalize_media_extension,
     normalize_path,
 )
@@ -106,6 +109,8 @@ class SettingSpec:
         default: Default value(s), used in the default configuration.
         allowed_values: Allowed values to choose from.
         normalize: Function converting a raw string into what is written to TOML.
+        parallel_normalize: Normalize multiple values concurrently. For IO bound
+            normalize functions, e.g. resolving paths on network shares.
         from_toml: Function converting value from TOML to the typed value.
         display: Function producing a human readable representation.
         validate_all: Function validating the final state before changes are applied.
@@ -118,10 +123,11 @@ class SettingSpec:
     key: str
     kind: Literal["scalar", "list"]
     value_type: type
-    actions: set[Action]
+    actions: frozenset[Action]
     default: Any
     allowed_values: list[Any] | None = None
     normalize: Callable[[str], Any] = lambda value: value
+    parallel_normalize: bool = False
     from_toml: Callable[[Any], Any] = lambda value: value
     display: Callable[[Any], str] = lambda value: str(value)
     validate_all: Callable[[Any], None] = lambda value: None
@@ -134,9 +140,13 @@ SETTINGS: dict[str, SettingSpec] = {
         key="search_paths",
         kind="list",
         value_type=str,
-        actions={"set", "add", "remove", "clear"},
+        actions=frozenset({"set", "add", "remove", "clear"}),
         normalize=normalize_path,
-        from_toml=lambda path: Path(path).resolve(),
+        # Resolving can take a long time per path on network shares
+        parallel_normalize=True,
+        # Stored paths were resolved by normalize_path already, so a lexical abspath
+        # suffices and avoids resolve's syscalls on every configuration load
+        from_toml=lambda path: Path(os.path.abspath(path)),
         default=[],
         validate_all=_validate_search_paths_overlap,
         after_update=lambda _: _rebuild_cache_if_enabled(),
@@ -146,18 +156,31 @@ SETTINGS: dict[str, SettingSpec] = {
         key="media_extensions",
         kind="list",
         value_type=str,
-        actions={"set", "add", "remove"},
+        actions=frozenset({"set", "add", "remove"}),
         normalize=normalize_media_extension,
         default=DEFAULT_MEDIA_EXTENSIONS,
         validate_all=validate_media_extensions,
         after_update=lambda _: _rebuild_cache_if_enabled(),
         help="Allowed media file extensions.",
     ),
+    "skip_dirs": SettingSpec(
+        key="skip_dirs",
+        kind="list",
+        value_type=str,
+        actions=frozenset({"set", "add", "remove", "clear"}),
+        normalize=normalize_dir_name,
+        default=DEFAULT_SKIP_DIRS,
+        after_update=lambda _: _rebuild_cache_if_enabled(),
+        help=(
+            "Names of directories that are skipped when scanning search paths, "
+            "e.g. NAS metadata or trash directories."
+        ),
+    ),
     "treat_rar_as_media": SettingSpec(
         key="treat_rar_as_media",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=True,
         allowed_values=[True, False],
@@ -169,7 +192,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="fullscreen_playback",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=True,
         allowed_values=[True, False],
@@ -180,7 +203,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="prefer_fd",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=True,
         allowed_values=[True, False],
@@ -191,7 +214,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="cache_library",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=False,
         allowed_values=[True, False],
@@ -203,7 +226,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="library_cache_interval",
         kind="scalar",
         value_type=timedelta,
-        actions={"set"},
+        actions=frozenset({"set"}),
         default=86400,
         from_toml=lambda interval_s: timedelta(seconds=int(interval_s)),
         help=(
@@ -216,7 +239,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="auto_wildcards",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=True,
         allowed_values=[True, False],
@@ -230,7 +253,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="parallel_search",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=True,
         allowed_values=[True, False],
@@ -244,7 +267,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="display_paths",
         kind="scalar",
         value_type=bool,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=normalize_bool_str,
         default=True,
         allowed_values=[True, False],
@@ -255,7 +278,7 @@ SETTINGS: dict[str, SettingSpec] = {
         key="video_player",
         kind="scalar",
         value_type=str,
-        actions={"set"},
+        actions=frozenset({"set"}),
         normalize=lambda s: s.lower().strip(),
         default="auto",
         allowed_values=["auto", "vlc", "mpv"],
@@ -285,6 +308,32 @@ def validate_allowed_value(value: Any, spec: SettingSpec) -> None:
         )
 
 
+def _normalize_values(
+    spec: SettingSpec, values: list[str], keep: set[Any]
+) -> list[Any]:
+    """Normalize values for a list setting.
+
+    Multiple values are normalized concurrently if the setting asks for it.
+
+    Args:
+        spec (SettingSpec): Setting the values belong to.
+        values (list[str]): Raw values.
+        keep (set[Any]): Values that are returned as they are without normalization.
+
+    Returns:
+        list[Any]: Normalized values in input order.
+    """
+
+    def normalize(value: str) -> Any:
+        return value if value in keep else spec.normalize(value)
+
+    if spec.parallel_normalize and len(values) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(values), 8)) as executor:
+            return list(executor.map(normalize, values))
+
+    return [normalize(value) for value in values]
+
+
 def _apply_action(
     raw_cfg: TOMLDocument, key: str, action: Action, values: list[str] | None
 ) -> None:
@@ -332,7 +381,13 @@ def _apply_action(
     if values is None:
         print_and_raise(f"Action '{action}' requires values for '{key}'.")
 
-    normalized_values = [spec.normalize(value) for value in values]
+    # Stored values are already normalized, so values to remove that are given
+    # verbatim can skip normalization (resolving search paths can be slow)
+    normalized_values = _normalize_values(
+        spec,
+        values,
+        keep=set(raw_cfg[key]) if action == "remove" else set(),  # type: ignore [arg-type]
+    )
 
     if action in ["set", "add"]:
         for value in normalized_values:
@@ -347,31 +402,42 @@ def _apply_action(
         spec.after_update(raw_cfg[key])
 
     elif action == "add":
+        # Membership is tested against sets, testing against the TOML array unwraps
+        # and compares every item
+        current_values = set(raw_cfg[key])  # type: ignore [arg-type]
+
         # Build hypothetical final state and validate before making changes
         final_state = list(raw_cfg[key])  # type: ignore [arg-type]
+        final_values = current_values.copy()
         for value in normalized_values:
-            if value not in final_state:
+            if value not in final_values:
                 final_state.append(value)
+                final_values.add(value)
         spec.validate_all(final_state)
 
         # Now actually add the values
         for value in normalized_values:
-            if value not in raw_cfg[key]:  # type: ignore [operator]
+            if value not in current_values:
                 raw_cfg[key].append(value)  # type: ignore [operator, union-attr, call-arg]
+                current_values.add(value)
                 print_ok(f"Added '{value}' to {key}.")
             else:
                 print_warn(f"{key} already contains '{value}', skipping.")
         spec.after_update(raw_cfg[key])
 
     elif action == "remove":
+        current_values = set(raw_cfg[key])  # type: ignore [arg-type]
+        values_to_remove = set(normalized_values)
+
         # Build hypothetical final state and validate before making changes
-        final_state = [v for v in raw_cfg[key] if v not in normalized_values]  # type: ignore [union-attr]
+        final_state = [v for v in raw_cfg[key] if v not in values_to_remove]  # type: ignore [union-attr]
         spec.validate_all(final_state)
 
         # Now actually remove the values
         for value in normalized_values:
-            if value in raw_cfg[key]:  # type: ignore [operator]
+            if value in current_values:
                 raw_cfg[key].remove(value)  # type: ignore [union-attr]
+                current_values.discard(value)
                 print_ok(f"Removed '{value}' from {key}.")
             else:
                 print_warn(f"'{value}' not found in {key}, skipping.")
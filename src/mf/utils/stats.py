@@ -22,6 +22,7 @@ Functions:
     create_log_bins(): Generate logarithmically-spaced bin edges
     get_log_bin_centers(): Calculate geometric mean bin centers
     group_values_by_bins(): Assign values to histogram bins
+    count_values_by_bins(): Count values per histogram bin
 
 Histogram Types:
     Categorical: Use get_string_counts() to create bins from string values
@@ -71,7 +72,7 @@ Examples:
 from __future__ import annotations
 
 import math
-from bisect import bisect_left
+from bisect import bisect_left, bisect_right
 from collections import Counter
 from collections.abc import Callable, Iterable
 from datetime import datetime
@@ -463,6 +464,32 @@ def group_values_by_bins(
     return bins
 
 
+def count_values_by_bins(values: list[float], bin_edges: list[float]) -> list[int]:
+    """Count values per histogram bin.
+
+    Bins values exactly like group_values_by_bins, but only counts them. Sorts the
+    values once and bisects them at each inner bin edge instead of locating the bin
+    of every single value.
+
+    Args:
+        values: List of numbers to bin
+        bin_edges: List of bin edge values (must be sorted ascending)
+
+    Returns:
+        list[int]: Length len(bin_edges)-1 list of bin counts.
+    """
+    sorted_values = sorted(values)
+    # Number of values up to and including each inner edge
+    cumulative_counts = [bisect_right(sorted_values, edge) for edge in bin_edges[1:-1]]
+
+    return [
+        upper - lower
+        for lower, upper in zip(
+            [0, *cumulative_counts], [*cumulative_counts, len(sorted_values)]
+        )
+    ]
+
+
 def get_string_counts(values: Iterable[str]) -> list[tuple[str, int]]:
     """Calculate the frequency distribution of string values.
 
@@ -514,9 +541,8 @@ def get_log_histogram(
 
     bin_edges = create_log_bins(min(values), max(values), bins_per_decade)
     bin_centers = get_log_bin_centers(bin_edges)
-    bins = group_values_by_bins(values, bin_edges)
 
-    return bin_centers, [len(bin) for bin in bins]
+    return bin_centers, count_values_by_bins(values, bin_edges)
 
 
 def print_distributions(results: FileResults, layout: ColumnLayout):
@@ -612,5 +638,9 @@ def print_stats(redact_paths: bool = False):
     cfg = Configuration.from_config()
     layout = ColumnLayout.from_terminal()
     library = load_library(show_progress=True)
-    print_summary(library, cfg.search_paths, redact_paths)
-    print_distributions(library, layout)
+
+    # Buffer the summary table and all histogram panels and write them to the
+    # terminal at once instead of flushing after every print
+    with console:
+        print_summary(library, cfg.search_paths, redact_paths)
+        print_distributions(library, layout)
@@ -10,6 +10,7 @@ Validation Strategy:
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from itertools import combinations
 from pathlib import Path
 from typing import Any
@@ -30,12 +31,31 @@ def validate_search_paths(search_paths: list[Path]) -> list[Path]:
         list[Path]: List of validated existing search paths.
     """
     validated: list[Path] = []
-
-    for search_path in search_paths:
-        if not search_path.exists():
-            print_warn(f"Configured search path {search_path} does not exist.")
-        else:
+    missing: list[Path] = []
+
+    # Search paths are often network mounts where each check can block for a while, so
+    # check them concurrently
+    if len(search_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(search_paths), 8)) as executor:
+            exists = list(executor.map(Path.exists, search_paths))
+    else:
+        exists = [search_path.exists() for search_path in search_paths]
+
+    for search_path, search_path_exists in zip(search_paths, exists):
+        if search_path_exists:
             validated.append(search_path)
+        else:
+            missing.append(search_path)
+
+    # Single warning for all missing paths
+    if len(missing) == 1:
+        print_warn(f"Configured search path {missing[0]} does not exist.")
+    elif missing:
+        print_warn(
+            f"{len(missing)} configured search paths don't exist: "
+            + ", ".join(str(search_path) for search_path in missing)
+            + "."
+        )
 
     if not validated:
         print_and_raise(
@@ -4,6 +4,7 @@ Provides the current package version and utilities to check for newer releases
 on PyPI. Used by the 'mf version --check' command.
 
 Functions:
+    print_version: Print local version and project websites
     get_pypi_version: Query PyPI API for latest published version
     check_version: Compare local version against PyPI and notify user
 
@@ -21,16 +22,22 @@ from __future__ import annotations
 import json
 import os
 from json import JSONDecodeError
-from urllib import request
 from urllib.error import URLError
 
 from packaging.version import Version
 
-from .utils.console import print_and_raise, print_info, print_ok
+from .utils.console import console, print_and_raise, print_info, print_ok
 
 __version__ = "0.11.0"
 
 
+def print_version():
+    """Print installed version of mediafinder and project websites."""
+    console.print(f"mediafinder {__version__}")
+    console.print("Github: https://github.com/aplzr/mf")
+    console.print("PyPI: https://pypi.org/project/mediafinder")
+
+
 def get_pypi_version() -> Version:
     """Get number of latest version published on PyPI
     (https://pypi.org/pypi/mediafinder).
@@ -38,6 +45,10 @@ def get_pypi_version() -> Version:
     Returns:
         Version: Version number.
     """
+    # Pulls in http.client and the email package, import here lazily so only the
+    # version check pays for it instead of every mf invocation
+    from urllib import request
+
     url = "https://pypi.org/pypi/mediafinder/json"
 
     try:
@@ -31,3 +31,24 @@ def test_save_and_load_cache(tmp_path, monkeypatch):
         print(expected.as_posix(), str(actual))
 
     assert timestamp is not None
+
+
+def test_interrupted_cache_write_keeps_previous_results():
+    import json
+
+    import pytest
+
+    save_search_results("*movie*", FileResults.from_paths(["/tmp/movie1.mp4"]))
+
+    def interrupted_dump(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(json, "dump", interrupted_dump)
+        with pytest.raises(KeyboardInterrupt):
+            save_search_results("*other*", FileResults.from_paths(["/tmp/other.mp4"]))
+
+    _, pattern, _ = load_search_results()
+    assert pattern == "*movie*"
+    # No temporary files are left behind
+    assert not list(get_search_cache_file().parent.glob("*.tmp"))
@@ -146,3 +146,17 @@ def test_cleanup_only_deletes_existing_files(runner):
     assert str(library_cache) not in result.stdout
     assert str(search_cache) not in result.stdout
     assert not config_file.exists()
+
+
+def test_cleanup_deletes_imdb_cache(runner):
+    """Test cleanup also deletes cached IMDB lookups."""
+    from mf.utils.file import get_imdb_cache_file
+
+    imdb_cache = get_imdb_cache_file()
+    imdb_cache.write_text("{}")
+
+    result = runner.invoke(app_mf, ["cleanup"], input="y\n")
+
+    assert result.exit_code == 0
+    assert str(imdb_cache) in result.stdout
+    assert not imdb_cache.exists()
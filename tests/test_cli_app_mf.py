@@ -165,3 +165,43 @@ def test_find_tty_detection(monkeypatch):
         # Should automatically output plain text
         assert str(test_path) in result.stdout
         assert "Search pattern:" not in result.stdout
+
+
+def test_lazy_subcommands_listed_in_help():
+    """Lazily loaded sub-apps still show up in the top-level help."""
+    result = runner.invoke(app_mf, ["--help"])
+    assert result.exit_code == 0
+    for name in ("last", "config", "cache"):
+        assert name in result.stdout
+
+
+def test_lazy_subcommand_dispatch():
+    """Sub-apps are loaded and dispatched on first use."""
+    result = runner.invoke(app_mf, ["config", "get", "video_player"])
+    assert result.exit_code == 0
+    assert "video_player = " in result.stdout
+
+
+def test_lazy_subcommand_help_matches_add_typer():
+    """Lazily loaded sub-apps have the same help as sub-apps added with add_typer."""
+    import typer
+
+    from mf.cli_cache import app_cache
+    from mf.cli_config import app_config
+    from mf.cli_last import app_last
+
+    for name, sub_app in (
+        ("last", app_last),
+        ("config", app_config),
+        ("cache", app_cache),
+    ):
+        reference = typer.Typer()
+        reference.add_typer(sub_app, name=name)
+        expected = runner.invoke(reference, [name, "--help"])
+
+        result = runner.invoke(app_mf, [name, "--help"])
+        assert result.exit_code == 0
+        assert result.stdout == expected.stdout
+        # Completion options belong to the top-level app only
+        assert "--install-completion" not in result.stdout
+        assert "--show-completion" not in result.stdout
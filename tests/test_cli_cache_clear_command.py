@@ -20,3 +20,27 @@ def test_cli_cache_clear_prints_success(monkeypatch, tmp_path):
     assert result.exit_code == 0
     assert "Cleared the library cache." in result.stdout
     assert not fake_cache.exists()
+
+
+def test_cli_cache_clear_imdb(monkeypatch, tmp_path):
+    runner = CliRunner()
+
+    library_cache = tmp_path / "library.pkl"
+    library_cache.write_bytes(b"")
+    imdb_cache = tmp_path / "imdb.json"
+    imdb_cache.write_text("{}")
+
+    monkeypatch.setattr(cli_cache, "get_library_cache_file", lambda: library_cache)
+    monkeypatch.setattr(cli_cache, "get_imdb_cache_file", lambda: imdb_cache)
+
+    result = runner.invoke(cli_cache.app_cache, ["clear", "--imdb"])
+
+    assert result.exit_code == 0
+    assert "Cleared the IMDB lookup cache." in result.stdout
+    assert not imdb_cache.exists()
+    # Only the IMDB lookups are cleared
+    assert library_cache.exists()
+
+    # Clearing again is fine when there's nothing cached
+    result = runner.invoke(cli_cache.app_cache, ["clear", "--imdb"])
+    assert result.exit_code == 0
@@ -40,6 +40,22 @@ def test_config_remove_missing(tmp_path, monkeypatch):
     assert "skipping" in r.stdout
 
 
+def test_config_remove_stored_value_skips_normalization(tmp_path, monkeypatch):
+    _set_env(monkeypatch, tmp_path)
+    runner.invoke(app_config, ["set", "search_paths", str(tmp_path / "p1")])
+    stored = str(get_raw_config()["search_paths"][0])
+
+    def fail(path_str):
+        raise AssertionError("stored value shouldn't be normalized again")
+
+    from mf.utils.settings import SETTINGS
+
+    monkeypatch.setattr(SETTINGS["search_paths"], "normalize", fail)
+    r = runner.invoke(app_config, ["remove", "search_paths", stored])
+    assert r.exit_code == 0
+    assert len(get_raw_config()["search_paths"]) == 0
+
+
 def test_config_set(tmp_path, monkeypatch):
     _set_env(monkeypatch, tmp_path)
     r = runner.invoke(app_config, ["set", "display_paths", "false"])  # disable
@@ -68,3 +84,44 @@ def test_config_file_outputs_path(tmp_path, monkeypatch):
     r = runner.invoke(app_config, ["file"])  # prints path
     assert r.exit_code == 0
     assert str(get_config_file()) in r.stdout
+
+
+def test_config_set_skip_dirs_rejects_blank_name(tmp_path, monkeypatch):
+    _set_env(monkeypatch, tmp_path)
+    before = list(get_raw_config()["skip_dirs"])
+    r = runner.invoke(app_config, ["set", "skip_dirs", " "])
+    assert r.exit_code != 0
+    assert list(get_raw_config()["skip_dirs"]) == before
+
+
+def test_config_set_search_paths_keeps_input_order(tmp_path, monkeypatch):
+    _set_env(monkeypatch, tmp_path)
+    paths = [tmp_path / name for name in ("c", "a", "b", "d")]
+    r = runner.invoke(app_config, ["set", "search_paths", *map(str, paths)])
+    assert r.exit_code == 0
+    assert list(get_raw_config()["search_paths"]) == [p.as_posix() for p in paths]
+
+
+def test_normalize_values_parallel_keeps_input_order():
+    import threading
+    import time
+    from dataclasses import replace
+
+    from mf.utils.settings import SETTINGS, _normalize_values
+
+    # All values have to be normalized at the same time for the barrier to release,
+    # and earlier values finish last
+    barrier = threading.Barrier(3, timeout=5)
+
+    def normalize(value):
+        barrier.wait()
+        time.sleep(0.01 * (3 - int(value)))
+        return f"normalized {value}"
+
+    spec = replace(SETTINGS["search_paths"], normalize=normalize)
+    assert spec.parallel_normalize
+    assert _normalize_values(spec, ["0", "1", "2"], keep=set()) == [
+        "normalized 0",
+        "normalized 1",
+        "normalized 2",
+    ]
@@ -27,3 +27,16 @@ def test_config_unknown_key_set():
         "prefer_fd",
     ]:
         assert expected in result.stdout
+
+
+def test_config_unknown_key_get(monkeypatch):
+    """Getting an unknown key should fail without loading the configuration."""
+
+    def fail():
+        raise AssertionError("configuration shouldn't be loaded for unknown keys")
+
+    monkeypatch.setattr("mf.cli_config.get_raw_config", fail)
+    result = runner.invoke(app_config, ["get", "unknown_key_xyz"])
+    assert result.exit_code != 0
+    assert "Invalid key: 'unknown_key_xyz'" in result.stdout
+    assert "search_paths" in result.stdout
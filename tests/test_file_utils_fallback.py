@@ -91,3 +91,16 @@ def test_permission_error_in_python_scanner(monkeypatch, tmp_path):
     monkeypatch.setattr(os, "scandir", fake_scandir)
     results = scan_search_paths()
     assert any(r.file.name == "ok.mp4" for r in results)
+
+
+def test_scan_search_paths_media_extensions(tmp_path):
+    """Only files with the requested extensions are returned by both scanners."""
+    media_dir = tmp_path / "media4"
+    media_dir.mkdir()
+    for name in ["a.MKV", "b.mp4", "c.txt"]:
+        (media_dir / name).write_text("x")
+
+    for prefer_fd in [True, False]:
+        _set_search_paths(tmp_path, [media_dir], prefer_fd=prefer_fd)
+        results = scan_search_paths(media_extensions=[".mkv", ".mp4"])
+        assert {res.file.name for res in results} == {"a.MKV", "b.mp4"}
@@ -27,3 +27,16 @@ def test_get_file_by_index_invalid(tmp_path, monkeypatch):
     with pytest.raises(click.exceptions.Exit) as exc:
         get_result_by_index(2)
     assert exc.value.exit_code == 1
+
+
+def test_get_file_by_index_not_positive():
+    import click
+    import pytest
+
+    save_search_results("*", [FileResult(Path("/tmp/some_movie.mp4"))])
+
+    # Must not wrap around to the end of the results
+    for index in (0, -1):
+        with pytest.raises(click.exceptions.Exit) as exc:
+            get_result_by_index(index)
+        assert exc.value.exit_code == 1
@@ -8,3 +8,92 @@ def test_init_main_and_version_importable():
     # main should exist and be callable
     assert hasattr(mf, "main")
     assert callable(mf.main)
+
+
+def test_init_does_not_import_cli_eagerly():
+    import subprocess
+    import sys
+
+    # Run in a fresh interpreter so modules imported by other tests don't interfere
+    code = "import sys, mf; print('mf.cli_main' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_does_not_import_imdb_dependencies_eagerly():
+    import subprocess
+    import sys
+
+    # guessit and imdbinfo are only needed by 'mf imdb' and must stay lazy imports
+    code = (
+        "import sys, mf.cli_main; "
+        "print('guessit' in sys.modules or 'imdbinfo' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_cli_does_not_import_urllib_request_eagerly():
+    import subprocess
+    import sys
+
+    # Only needed by 'mf version check', pulls in http.client and the email package
+    code = "import sys, mf.cli_main; print('urllib.request' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_main_version_fast_path(monkeypatch, capsys):
+    import sys
+
+    import mf
+
+    monkeypatch.setattr(sys, "argv", ["mf", "version"])
+    mf.main()
+    out = capsys.readouterr().out
+    assert f"mediafinder {mf.__version__}" in out
+    assert "PyPI" in out
+
+
+def test_main_filepath_fast_path(monkeypatch, capsys, tmp_path):
+    import sys
+
+    import pytest
+
+    import mf
+    from mf.utils.file import FileResult
+    from mf.utils.search import save_search_results
+
+    media_file = tmp_path / "movie.mkv"
+    media_file.write_text("x")
+    save_search_results("*", [FileResult(media_file)])
+
+    monkeypatch.setattr(sys, "argv", ["mf", "filepath", "1"])
+    mf.main()
+    assert capsys.readouterr().out.strip() == str(media_file)
+
+    # Errors exit with status 1 instead of leaking typer.Exit
+    monkeypatch.setattr(sys, "argv", ["mf", "filepath", "5"])
+    with pytest.raises(SystemExit) as exc_info:
+        mf.main()
+    assert exc_info.value.code == 1
+
+
+def test_main_filepath_fast_path_non_decimal_digit(monkeypatch):
+    import sys
+
+    import pytest
+
+    import mf
+
+    # Digits like "²" aren't valid integers, Typer reports them as a usage error
+    monkeypatch.setattr(sys, "argv", ["mf", "filepath", "²"])
+    with pytest.raises(SystemExit) as exc_info:
+        mf.main()
+    assert exc_info.value.code == 2
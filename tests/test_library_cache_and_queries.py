@@ -275,3 +275,34 @@ def test_split_by_search_path_nested_paths(tmp_path):
     assert len(split[str(path2)]) == 1
     assert file1 in [r.get_path() for r in split[str(path1)]]
     assert file2 in [r.get_path() for r in split[str(path2)]]
+
+
+def test_filter_by_pattern_case_insensitive():
+    results = FileResults.from_paths(
+        ["/media/The.Matrix.1999.MKV", "/media/matrix_reloaded.mp4", "/media/other.mkv"]
+    )
+    results.filter_by_pattern("*MATRIX*.mkv")
+    assert [r.file.name for r in results] == ["The.Matrix.1999.MKV"]
+
+
+def test_filter_by_pattern_wildcards_only_keeps_all(monkeypatch):
+    results = FileResults.from_paths(["/media/a.mkv", "/media/.hidden.mp4"])
+
+    def fail(pattern):
+        raise AssertionError("wildcard-only patterns shouldn't be compiled")
+
+    monkeypatch.setattr("mf.utils.file._compile_glob", fail)
+    results.filter_by_pattern("**")
+    assert len(results) == 2
+
+
+def test_sort_by_name_casefolds():
+    results = FileResults.from_paths(
+        ["/media/strasz.mkv", "/media/Straße.mkv", "/media/STRASSE_2.mkv"]
+    )
+    results.sort()
+    assert [r.file.name for r in results] == [
+        "Straße.mkv",
+        "STRASSE_2.mkv",
+        "strasz.mkv",
+    ]
@@ -1,5 +1,6 @@
 from mf.utils.normalizers import (
     normalize_bool_str,
+    normalize_dir_name,
     normalize_media_extension,
     normalize_pattern,
 )
@@ -26,3 +27,14 @@ def test_normalize_bool_str_true_values():
 def test_normalize_bool_str_false_values():
     for val in ["false", "No", "off", "0", "disable", "disabled"]:
         assert normalize_bool_str(val) is False
+
+
+def test_normalize_dir_name_strips_and_rejects_empty():
+    import click
+    import pytest
+
+    assert normalize_dir_name("  @eaDir ") == "@eaDir"
+
+    for name in ("", "   "):
+        with pytest.raises(click.exceptions.Exit):
+            normalize_dir_name(name)
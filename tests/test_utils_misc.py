@@ -16,3 +16,58 @@ def test_get_vlc_command_windows_paths():
     if resolved:
         assert resolved.label == "vlc"
         assert str(resolved.path).endswith("vlc.exe") or str(resolved.path) == "vlc"
+
+
+def test_open_imdb_entry_caches_lookups(monkeypatch, tmp_path):
+    import sys
+    from types import ModuleType, SimpleNamespace
+
+    from mf.utils.file import FileResult
+    from mf.utils.misc import open_imdb_entry
+
+    lookups = []
+
+    def search_title(title):
+        lookups.append(title)
+        return SimpleNamespace(
+            titles=[SimpleNamespace(url="https://www.imdb.com/title/tt0017136/")]
+        )
+
+    guessit_module = ModuleType("guessit")
+    guessit_module.guessit = lambda stem: {"title": "Metropolis"}
+    imdbinfo_module = ModuleType("imdbinfo")
+    imdbinfo_module.search_title = search_title
+    monkeypatch.setitem(sys.modules, "guessit", guessit_module)
+    monkeypatch.setitem(sys.modules, "imdbinfo", imdbinfo_module)
+
+    launched = []
+    monkeypatch.setattr("mf.utils.misc.typer.launch", launched.append)
+
+    result = FileResult(tmp_path / "Metropolis.1927.1080p.mkv")
+    open_imdb_entry(result)
+    open_imdb_entry(result)
+
+    # Second lookup is served from the cache
+    assert lookups == ["Metropolis"]
+    assert launched == ["https://www.imdb.com/title/tt0017136/"] * 2
+
+
+def test_load_imdb_cache_ignores_unexpected_structure():
+    import json
+
+    from mf.utils.file import get_imdb_cache_file
+    from mf.utils.misc import _load_imdb_cache
+
+    cache_file = get_imdb_cache_file()
+
+    for content in (
+        [],
+        {"Metropolis.1927": "https://www.imdb.com/title/tt0017136/"},
+        {"Metropolis.1927": {"title": "Metropolis", "url": 1}},
+    ):
+        cache_file.write_text(json.dumps(content))
+        assert _load_imdb_cache() == {}
+
+    valid = {"Metropolis.1927": {"title": "Metropolis", "url": "https://imdb.com/"}}
+    cache_file.write_text(json.dumps(valid))
+    assert _load_imdb_cache() == valid
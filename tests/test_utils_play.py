@@ -1,5 +1,6 @@
 """Unit tests for utils/play.py functions."""
 
+import os
 from pathlib import Path
 import pytest
 from click.exceptions import Exit as ClickExit
@@ -227,6 +228,22 @@ class TestLaunchVideoPlayer:
         assert "movie.mp4" in captured.out
         assert "vlc launched successfully" in captured.out
 
+    def test_launch_keeps_fds_open_on_posix(self, monkeypatch):
+        """Test player is launched with close_fds=False on POSIX (posix_spawn)."""
+        popen_kwargs = {}
+
+        def mock_popen(*args, **kwargs):
+            popen_kwargs.update(kwargs)
+
+        mock_player = ResolvedPlayer("vlc", Path("vlc"))
+        monkeypatch.setattr("mf.utils.play.resolve_configured_player", lambda cfg: mock_player)
+        monkeypatch.setattr("mf.utils.play.subprocess.Popen", mock_popen)
+        monkeypatch.setattr("pathlib.Path.exists", lambda self: True)
+
+        launch_video_player(FileResult(Path("/tmp/movie.mp4")), Configuration.from_config())
+
+        assert popen_kwargs["close_fds"] is (os.name == "nt")
+
     def test_launch_playlist(self, monkeypatch, capsys):
         """Test launching VLC with FileResults (playlist)."""
         popen_args = None
@@ -1,6 +1,9 @@
 import os
 from pathlib import Path
 from types import SimpleNamespace
+
+import pytest
+
 from mf.utils.file import FileResult, FileResults
 from mf.utils.scan import (
     FindQuery,
@@ -32,6 +35,121 @@ def test_scan_path_with_python_basic(tmp_path: Path):
     assert paths == {"a.txt", "b.mp4"}
 
 
+def test_scan_path_with_python_deeply_nested(tmp_path: Path):
+    import inspect
+    import sys
+
+    d = tmp_path / "root"
+    deepest = d.joinpath(*["a"] * 200)
+    deepest.mkdir(parents=True)
+    (deepest / "deep.mkv").write_text("x")
+    (d / "top.mkv").write_text("x")
+
+    # Nesting depth exceeds the remaining recursion budget, so this only works if
+    # scanning doesn't recurse per directory
+    recursion_limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(len(inspect.stack()) + 100)
+    try:
+        results = scan_path_with_python(d, with_mtime=False)
+    finally:
+        sys.setrecursionlimit(recursion_limit)
+
+    assert {r.file.name for r in results} == {"deep.mkv", "top.mkv"}
+
+
+def test_scan_path_with_python_skip_dirs(tmp_path: Path):
+    d = tmp_path / "root"
+    (d / "@eaDir" / "nested").mkdir(parents=True)
+    (d / "@eaDir" / "nested" / "thumb.mkv").write_text("x")
+    (d / "movies").mkdir()
+    (d / "movies" / "movie.mkv").write_text("x")
+
+    results = scan_path_with_python(d, skip_dirs=frozenset({"@eaDir"}))
+    assert {r.file.name for r in results} == {"movie.mkv"}
+
+
+def test_scan_path_with_fd_excludes_skip_dirs(monkeypatch, tmp_path: Path):
+    import mf.utils.scan as scan_mod
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(stdout=b"")
+
+    monkeypatch.setattr(scan_mod.subprocess, "run", fake_run)
+    scan_mod.scan_path_with_fd(tmp_path, skip_dirs=frozenset({"@eaDir", "[old]", ""}))
+
+    cmd = calls[0]
+    assert cmd[-2:] == [".", str(tmp_path)]
+    excludes = {cmd[i + 1] for i, arg in enumerate(cmd) if arg == "--exclude"}
+    # Glob metacharacters are escaped so names match literally, only directories are
+    # excluded, and empty names are dropped instead of excluding everything
+    assert excludes == {"@eaDir/", "[[]old[]]/"}
+
+
+def test_scan_path_with_fd_skips_only_directories(tmp_path: Path):
+    import subprocess
+
+    import mf.utils.scan as scan_mod
+
+    try:
+        subprocess.run(
+            [str(scan_mod.get_fd_binary()), "--version"],
+            capture_output=True,
+            check=True,
+        )
+    except (OSError, RuntimeError, subprocess.CalledProcessError):
+        pytest.skip("fd binary not available on this platform")
+
+    (tmp_path / "@eaDir").mkdir()
+    (tmp_path / "@eaDir" / "thumb.mkv").write_text("x")
+    (tmp_path / "movies").mkdir()
+    # A file with a skipped directory's name is kept, like the Python scanner does
+    (tmp_path / "movies" / "@eaDir").write_text("x")
+
+    skip_dirs = frozenset({"@eaDir"})
+    fd_results = scan_mod.scan_path_with_fd(tmp_path, skip_dirs=skip_dirs)
+    python_results = scan_path_with_python(tmp_path, skip_dirs=skip_dirs)
+
+    assert {r.file for r in fd_results} == {r.file for r in python_results}
+    assert {r.file for r in fd_results} == {tmp_path / "movies" / "@eaDir"}
+
+
+def test_scan_path_with_fd_filters_extensions(monkeypatch, tmp_path: Path):
+    import mf.utils.scan as scan_mod
+
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        # fd's output is read as bytes
+        return SimpleNamespace(stdout=os.fsencode(tmp_path / "movie.mkv") + b"\n")
+
+    monkeypatch.setattr(scan_mod.subprocess, "run", fake_run)
+    results = scan_mod.scan_path_with_fd(tmp_path, media_extensions=[".mkv", ".mp4"])
+
+    cmd = calls[0]
+    extensions = [cmd[i + 1] for i, arg in enumerate(cmd) if arg == "--extension"]
+    assert extensions == ["mkv", "mp4"]
+    assert [r.file for r in results] == [tmp_path / "movie.mkv"]
+
+
+@pytest.mark.skipif(os.name == "nt", reason="Requires bytes file names (POSIX)")
+def test_scan_path_with_fd_non_utf8_name(tmp_path: Path):
+    from mf.utils.scan import scan_path_with_fd
+
+    name = b"caf\xe9.mkv"  # Latin-1, not valid UTF-8
+    try:
+        with open(os.path.join(os.fsencode(tmp_path), name), "wb"):
+            pass
+    except OSError:
+        pytest.skip("File system doesn't accept non-UTF-8 file names")
+
+    results = scan_path_with_fd(tmp_path)
+    assert [os.fsencode(r.file.name) for r in results] == [name]
+
+
 def test_scan_path_with_python_permission_error(monkeypatch, tmp_path: Path, capsys):
     d = tmp_path / "root"
     d.mkdir()
@@ -93,7 +211,8 @@ def test_find_query_filters_and_sorts(monkeypatch, tmp_path: Path):
                         media_extensions=[".mp4", ".mkv"],
                         search_paths=[tmp_path.as_posix()],
                         auto_wildcards=True,
-                        parallel_search=True)
+                        parallel_search=True,
+                        skip_dirs=[])
     )
     # Create files
     (tmp_path / "b.mkv").write_text("x")
@@ -114,6 +233,25 @@ def test_find_query_filters_and_sorts(monkeypatch, tmp_path: Path):
     assert names == ["a.mp4", "b.mkv"]
 
 
+def test_find_query_without_sorting(monkeypatch, tmp_path: Path):
+    (tmp_path / "a.mp4").write_text("x")
+    (tmp_path / "b.mp4").write_text("x")
+
+    monkeypatch.setattr("mf.utils.scan.validate_search_paths", lambda paths: [tmp_path])
+    monkeypatch.setattr(
+        "mf.utils.scan.FileResults.sort",
+        lambda self, **kwargs: pytest.fail("Results must not be sorted"),
+    )
+    results = FindQuery(
+        "*",
+        auto_wildcards=False,
+        sort=False,
+        cache_library=False,
+        media_extensions=[".mp4"],
+    ).execute()
+    assert {r.file.name for r in results} == {"a.mp4", "b.mp4"}
+
+
 def test_new_query_latest(monkeypatch, tmp_path: Path):
     # No cache; collect mtimes and sort by newest first
     # Create files with different mtimes
@@ -132,6 +270,21 @@ def test_new_query_latest(monkeypatch, tmp_path: Path):
     names = [r.file.name for r in results]
     assert names == ["b.mp4", "a.mp4"]
 
+
+def test_new_query_returns_only_n_newest(monkeypatch, tmp_path: Path):
+    # Files with increasing age, plus a newer file that is filtered by extension
+    for age, name in enumerate(["c.mp4", "b.mp4", "a.mp4"]):
+        file = tmp_path / name
+        file.write_text("x")
+        os.utime(file, (os.path.getatime(file), os.path.getmtime(file) - 10 * age))
+
+    (tmp_path / "newest.txt").write_text("x")
+
+    monkeypatch.setattr("mf.utils.scan.validate_search_paths", lambda paths: [tmp_path])
+    results = NewQuery(2, cache_library=False, media_extensions=[".mp4"]).execute()
+    assert [r.file.name for r in results] == ["c.mp4", "b.mp4"]
+
+
 def test_find_query_auto_wildcards_setting():
     """Test FindQuery pattern setting respects auto_wildcards parameter."""
     # With auto_wildcards=True, pattern should be wrapped
@@ -287,13 +440,31 @@ def test_fd_scan_strategy_basic(tmp_path: Path, monkeypatch):
     assert names == {"file1.mp4", "file2.mkv"}
 
 
+def test_fd_scan_strategy_resolves_fd_binary_once(tmp_path: Path, monkeypatch):
+    import mf.utils.scan as scan_mod
+
+    calls = []
+
+    def counting_get_fd_binary():
+        calls.append(True)
+        return Path("fd")
+
+    monkeypatch.setattr(scan_mod, "get_fd_binary", counting_get_fd_binary)
+    monkeypatch.setattr(
+        scan_mod.subprocess, "run", lambda cmd, **kwargs: SimpleNamespace(stdout=b"")
+    )
+
+    FdScanStrategy().scan([tmp_path / "a", tmp_path / "b", tmp_path / "c"], 3)
+    assert len(calls) == 1
+
+
 def test_fd_scan_strategy_fallback_to_python(tmp_path: Path, monkeypatch):
     """Test FdScanStrategy.scan() falls back to Python when fd fails."""
     # Create test files
     (tmp_path / "file1.mp4").write_text("x")
 
     # Mock scan_path_with_fd to raise an error
-    def mock_scan_path_with_fd(path):
+    def mock_scan_path_with_fd(path, **kwargs):
         raise FileNotFoundError("fd binary not found")
 
     monkeypatch.setattr("mf.utils.scan.scan_path_with_fd", mock_scan_path_with_fd)
@@ -311,7 +482,7 @@ def test_fd_scan_strategy_fallback_on_os_error(tmp_path: Path, monkeypatch, caps
     (tmp_path / "file1.mp4").write_text("x")
 
     # Mock scan_path_with_fd to raise OSError
-    def mock_scan_path_with_fd(path):
+    def mock_scan_path_with_fd(path, **kwargs):
         raise OSError("Permission denied")
 
     monkeypatch.setattr("mf.utils.scan.scan_path_with_fd", mock_scan_path_with_fd)
@@ -13,7 +13,8 @@ def test_scan_search_paths_progress_no_estimate(monkeypatch, tmp_path: Path):
                     cache_library=False,
                     media_extensions=[],
                     search_paths=[tmp_path.as_posix()],
-                    parallel_search=True)
+                    parallel_search=True,
+                    skip_dirs=[])
     )
 
     monkeypatch.setattr("mf.utils.scan.validate_search_paths", lambda paths: [tmp_path])
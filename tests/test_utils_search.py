@@ -0,0 +1,15 @@
+from mf.utils.file import FileResults
+from mf.utils.search import print_search_results, save_search_results
+
+
+def test_print_large_search_results_as_lines(monkeypatch, capsys):
+    monkeypatch.setattr("mf.utils.search.LARGE_RESULTS_THRESHOLD", 3)
+    results = FileResults.from_paths([f"/media/movie{i}.mkv" for i in range(1, 6)])
+    save_search_results("*movie*", results)
+
+    print_search_results(results, "Search pattern: *movie*", display_paths=True)
+    out = capsys.readouterr().out
+    assert "Search pattern: *movie*" in out
+    assert "5 movie5.mkv /media" in out
+    # No table panel border
+    assert "╭" not in out
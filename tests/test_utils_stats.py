@@ -6,6 +6,7 @@ from rich.panel import Panel
 from types import SimpleNamespace
 from mf.utils.console import ColumnLayout, PanelFormat
 from mf.utils.stats import (
+    count_values_by_bins,
     create_log_bins,
     get_log_bin_centers,
     get_log_histogram,
@@ -49,6 +50,14 @@ def test_group_values_by_bins_clamping():
     assert 500 in bins[1]
 
 
+def test_count_values_by_bins_matches_grouping():
+    edges = [1, 10, 100, 1000]
+    values = [-5, 1, 9, 10, 11, 99, 100, 500, 1000, 5000]
+    counts = count_values_by_bins(values, edges)
+    assert counts == [len(bin) for bin in group_values_by_bins(values, edges)]
+    assert counts == [4, 3, 3]
+
+
 def test_get_string_counts_basic():
     counts = get_string_counts(["a", "b", "a", "c", "b", "a"])
     # Validate as set for order-insensitivity
@@ -373,6 +382,42 @@ def test_print_stats_runs_without_error(monkeypatch, tmp_path):
     print_stats()
 
 
+def test_print_stats_writes_output_at_once(monkeypatch, tmp_path):
+    """Test that print_stats buffers the summary and histograms into one write."""
+    import io
+
+    from rich.console import Console
+
+    from mf.utils.file import FileResult, FileResults
+
+    files = [tmp_path / "movie.1080p.mp4", tmp_path / "show.720p.mp4"]
+    for size, f in enumerate(files, start=1):
+        f.write_bytes(b"0" * 1000 * size)
+    results = FileResults([FileResult(f, os.stat(f)) for f in files])
+
+    monkeypatch.setattr(
+        "mf.utils.stats.Configuration.from_config",
+        lambda: SimpleNamespace(media_extensions=[".mp4"], search_paths=[str(tmp_path)]),
+    )
+    monkeypatch.setattr("mf.utils.stats.load_library", lambda show_progress: results)
+
+    writes = []
+
+    class RecordingFile(io.StringIO):
+        def write(self, text):
+            writes.append(text)
+            return super().write(text)
+
+    # Summary and histograms are printed through the shared console from both modules
+    recording_console = Console(file=RecordingFile(), width=120)
+    monkeypatch.setattr("mf.utils.stats.console", recording_console)
+    monkeypatch.setattr("mf.utils.console.console", recording_console)
+    print_stats()
+
+    assert len(writes) == 1
+    assert "Resolution" in writes[0]
+
+
 def test_make_histogram_empty_bins():
     """Test that make_histogram handles empty bins gracefully."""
     from mf.utils.stats import make_histogram
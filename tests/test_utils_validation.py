@@ -131,6 +131,35 @@ def test_validate_search_paths_empty_list(monkeypatch):
         validate_search_paths([])
 
 
+def test_validate_search_paths_single_warning_for_missing(tmp_path: Path, capsys):
+    """Test missing paths are reported in a single warning."""
+    existing_dir = tmp_path / "media"
+    existing_dir.mkdir()
+    missing1 = tmp_path / "missing1"
+    missing2 = tmp_path / "missing2"
+
+    validate_search_paths([missing1, existing_dir, missing2])
+    out = capsys.readouterr().out
+    assert out.count("⚠") == 1
+    assert "2 configured search paths don't exist" in out
+
+
+def test_validate_search_paths_checks_concurrently(monkeypatch, tmp_path: Path):
+    """Test search paths are checked concurrently, not one after another."""
+    import threading
+
+    # Both checks have to be waiting at the same time for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+
+    def exists(self):
+        barrier.wait()
+        return self.name == "media1"
+
+    monkeypatch.setattr(Path, "exists", exists)
+    result = validate_search_paths([tmp_path / "media1", tmp_path / "media2"])
+    assert result == [tmp_path / "media1"]
+
+
 # Search path overlap validation tests
 
 